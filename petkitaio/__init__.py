@@ -6,6 +6,7 @@ from .constants import (
     FeederCommand,
     FEEDER_LIST,
     FeederSetting,
+    LB_CMD_INFO,
     LB_CMD_TO_KEY,
     LB_CMD_TO_TYPE,
     LB_CMD_TO_VALUE,
@@ -18,6 +19,7 @@ from .constants import (
     PurifierCommand,
     PurifierCommandKey,
     PurifierCommandType,
+    PUR_CMD_INFO,
     PUR_CMD_TO_KEY,
     PUR_CMD_TO_TYPE,
     PUR_CMD_TO_VALUE,
@@ -43,8 +45,8 @@ from .model import (Feeder, LitterBox, Pet, PetKitData, Purifier, W5Fountain, )
 from .str_enum import StrEnum
 
 __all__ = ['AuthError', 'AUTH_ERROR_CODES', 'BLE_HEADER', 'BluetoothError', 'BLUETOOTH_ERRORS', 'CLIENT_DICT', 'Feeder', 'Endpoint', 'FeederCommand',
-           'FEEDER_LIST', 'FeederSetting', 'Header', 'LB_CMD_TO_KEY', 'LB_CMD_TO_TYPE', 'LB_CMD_TO_VALUE', 'LitterBox', 'LitterBoxCommand', 'LitterBoxCommandKey',
+           'FEEDER_LIST', 'FeederSetting', 'Header', 'LB_CMD_INFO', 'LB_CMD_TO_KEY', 'LB_CMD_TO_TYPE', 'LB_CMD_TO_VALUE', 'LitterBox', 'LitterBoxCommand', 'LitterBoxCommandKey',
            'LitterBoxCommandType', 'LitterBoxSetting', 'LITTER_LIST', 'LOGGER', 'Pet', 'PetKitClient', 'PetKitData', 'PetKitError', 'PetSetting', 'Purifier',
-           'PurifierCommand', 'PurifierCommandKey', 'PurifierCommandType', 'PUR_CMD_TO_KEY', 'PUR_CMD_TO_TYPE', 'PUR_CMD_TO_VALUE', 'PURIFIER_LIST', 'PurifierSetting', 'Region',
+           'PurifierCommand', 'PurifierCommandKey', 'PurifierCommandType', 'PUR_CMD_INFO', 'PUR_CMD_TO_KEY', 'PUR_CMD_TO_TYPE', 'PUR_CMD_TO_VALUE', 'PURIFIER_LIST', 'PurifierSetting', 'Region',
            'RegionError', 'ServerError', 'SERVER_ERROR_CODES', 'StrEnum', 'TIMEOUT', 'TimezoneError', 'WATER_FOUNTAIN_LIST', 'W5Command', 'W5_COMMAND_TO_CODE', 'W5_DND_COMMANDS', 'W5Fountain', 'W5_LIGHT_BRIGHTNESS',
            'W5_LIGHT_POWER', 'W5_MODE', 'W5_SETTINGS_COMMANDS',  ]
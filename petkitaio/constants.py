@@ -350,6 +350,18 @@ PUR_CMD_TO_VALUE = {
     PurifierCommand.STRONG_MODE: 3
 }
 
+# (key, type, value) for each command so the control methods only need one lookup.
+# POWER has no fixed value since it toggles the current power state.
+LB_CMD_INFO = {
+    command: (key, LB_CMD_TO_TYPE[command], LB_CMD_TO_VALUE.get(command))
+    for command, key in LB_CMD_TO_KEY.items()
+}
+
+PUR_CMD_INFO = {
+    command: (key, PUR_CMD_TO_TYPE[command], PUR_CMD_TO_VALUE.get(command))
+    for command, key in PUR_CMD_TO_KEY.items()
+}
+
 W5_COMMAND_TO_CODE = {
     W5Command.DO_NOT_DISTURB: '221',
     W5Command.DO_NOT_DISTURB_OFF: '221',
@@ -4,16 +4,23 @@ from __future__ import annotations
 import base64
 from typing import Any
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from itertools import chain
 import json
 import logging
-import urllib.parse as urlencode
+import math
+import time
+from urllib.parse import urlencode
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
 import hashlib
 from tzlocal import get_localzone_name
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from petkitaio.constants import (
     AUTH_ERROR_CODES,
     BLE_HEADER,
@@ -24,17 +31,13 @@ from petkitaio.constants import (
     FEEDER_LIST,
     FeederSetting,
     Header,
-    LB_CMD_TO_KEY,
-    LB_CMD_TO_TYPE,
-    LB_CMD_TO_VALUE,
+    LB_CMD_INFO,
     LitterBoxCommand,
     LitterBoxSetting,
     LITTER_LIST,
     PetSetting,
     PurifierCommand,
-    PUR_CMD_TO_KEY,
-    PUR_CMD_TO_TYPE,
-    PUR_CMD_TO_VALUE,
+    PUR_CMD_INFO,
     PURIFIER_LIST,
     PurifierSetting,
     Region,
@@ -53,18 +56,151 @@ from petkitaio.model import (Feeder, LitterBox, Pet, PetKitData, Purifier, W5Fou
 
 LOGGER = logging.getLogger(__name__)
 
+# How long the region server list is reused before it is fetched again (seconds)
+_SERVER_LIST_TTL = 24 * 60 * 60
+
+# Device type -> PetKitData field the parsed device is stored in
+_DEVICE_CATEGORY: dict[str, str] = {
+    **dict.fromkeys(FEEDER_LIST, 'feeders'),
+    **dict.fromkeys(LITTER_LIST, 'litter_boxes'),
+    **dict.fromkeys(PURIFIER_LIST, 'purifiers'),
+    **dict.fromkeys(WATER_FOUNTAIN_LIST, 'water_fountains'),
+}
+
+# Lowercase device types as used in API endpoints
+_DEVICE_TYPE_LOWER: dict[str, str] = {
+    device_type: device_type.lower()
+    for device_type in chain(FEEDER_LIST, LITTER_LIST, PURIFIER_LIST, WATER_FOUNTAIN_LIST)
+}
+
+
+def _encode_ble_bytes(payload: bytes | bytearray) -> str:
+    """URL encode the base64 representation of a BLE payload."""
+
+    # base64 output only contains A-Z, a-z, 0-9, +, / and =, so only the last three need escaping
+    b64_encoded = base64.b64encode(payload).decode('ascii')
+    return b64_encoded.replace('+', '%2B').replace('/', '%2F').replace('=', '%3D')
+
+
+# W5 commands whose payload is fixed apart from the BLE sequence byte at _W5_SEQUENCE_INDEX
+_W5_SEQUENCE_INDEX = 5
+_W5_TEMPLATES: dict[W5Command, bytes] = {
+    command: bytes(x & 0xFF for x in byte_list)
+    for command, byte_list in {
+        W5Command.FIRST_BLE_CMND: [-6, -4, -3, -41, 1, 0, 0, 0, -5],
+        W5Command.SECOND_BLE_CMND: [-6, -4, -3, -40, 1, 0, 0, 0, -5],
+        W5Command.NORMAL_TO_PAUSE: [-6, -4, -3, -36, 1, 0, 2, 0, 0, 1, -5],
+        W5Command.SMART_TO_PAUSE: [-6, -4, -3, -36, 1, 0, 2, 0, 0, 2, -5],
+        W5Command.NORMAL: [-6, -4, -3, -36, 1, 0, 2, 0, 1, 1, -5],
+        W5Command.SMART: [-6, -4, -3, -36, 1, 0, 2, 0, 1, 2, -5],
+        W5Command.RESET_FILTER: [-6, -4, -3, -34, 1, 0, 0, 0, -5],
+    }.items()
+}
+
+# Pre-encoded fixed commands, indexed by BLE sequence value (0-255)
+_W5_ENCODED: dict[W5Command, tuple[str, ...]] = {
+    command: tuple(
+        _encode_ble_bytes(template[:_W5_SEQUENCE_INDEX] + bytes((sequence,)) + template[_W5_SEQUENCE_INDEX + 1:])
+        for sequence in range(256)
+    )
+    for command, template in _W5_TEMPLATES.items()
+}
+
+# W5 settings commands -> value written into the settings payload, sent with command byte _W5_SETTINGS_CMD
+_W5_SETTINGS_CMD = -35
+# Masked bytes that precede the sequence byte in every settings payload
+_W5_SETTINGS_PREFIX = bytes(x & 0xFF for x in (*BLE_HEADER, _W5_SETTINGS_CMD, 1))
+_W5_SETTING_VALUES: dict[W5Command, int] = {
+    W5Command.LIGHT_OFF: 0,
+    W5Command.LIGHT_ON: 1,
+    W5Command.LIGHT_LOW: 1,
+    W5Command.LIGHT_MEDIUM: 2,
+    W5Command.LIGHT_HIGH: 3,
+    W5Command.DO_NOT_DISTURB: 1,
+    W5Command.DO_NOT_DISTURB_OFF: 0,
+}
+
+# Feeder endpoints by action: (endpoint used by most feeders under '<type>/',
+# {feeder type: (endpoint, whether it is prefixed with the feeder type)} for the exceptions)
+_FEEDER_ENDPOINTS: dict[str, tuple[Endpoint, dict[str, tuple[Endpoint, bool]]]] = {
+    'manual_feed': (Endpoint.MANUAL_FEED, {
+        'feedermini': (Endpoint.MINI_MANUAL_FEED, False),
+        'feeder': (Endpoint.FRESH_ELEMENT_MANUAL_FEED, False),
+    }),
+    'setting': (Endpoint.UPDATE_SETTING, {
+        'feedermini': (Endpoint.MINI_SETTING, False),
+        'feeder': (Endpoint.FRESH_ELEMENT_SETTING, False),
+    }),
+    'cancel_feed': (Endpoint.CANCEL_FEED, {
+        'feeder': (Endpoint.FRESH_ELEMENT_CANCEL_FEED, True),
+    }),
+    'desiccant_reset': (Endpoint.FEEDER_DESICCANT_RESET, {
+        'feedermini': (Endpoint.MINI_DESICCANT_RESET, False),
+        'feeder': (Endpoint.FRESH_ELEMENT_DESICCANT_RESET, False),
+    }),
+}
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a value embedded in a request body, such as the kv field."""
+
+    if orjson is not None:
+        # Setting keys are StrEnum members which orjson only accepts with OPT_NON_STR_KEYS
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse the raw body of an API response."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _form_body(data: dict[str, Any]) -> bytes:
+    """URL encode a request body, matching what aiohttp produces for form data."""
+
+    return urlencode(data, doseq=True).encode()
+
+
+def _kv(key: str, value: Any) -> str:
+    """Serialize a single setting or command as the JSON object sent in the kv field."""
+
+    # Nearly every kv payload is one key with an int/float value, which doesn't need a JSON encoder
+    simple_value = type(value) is int or (type(value) is float and math.isfinite(value))
+    if simple_value and isinstance(key, str) and '"' not in key and '\\' not in key:
+        return '{"' + key + '":' + repr(value) + '}'
+    return _json_dumps({key: value})
+
+
+def _pretty_json(obj: Any) -> str:
+    """Serialize an API response for debug logging."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=4)
+
 
 class PetKitClient:
     """PetKit client."""
 
     def __init__(
-        self, username: str, password: str, session: ClientSession | None = None, region: str = None, timezone: str = None, timeout: int = TIMEOUT
+        self,
+        username: str,
+        password: str,
+        session: ClientSession | None = None,
+        region: str = None,
+        timezone: str = None,
+        timeout: int = TIMEOUT,
+        ble_cache_ttl: float = 0,
     ) -> None:
         """Initialize PetKit Client.
 
         username: PetKit username/email
         password: PetKit account password
-        session: aiohttp.ClientSession or None to create a new session
+        session: aiohttp.ClientSession or None to create a new session on first use
+        ble_cache_ttl: Seconds to reuse water fountain data after a successful BLE relay refresh (0 disables)
         """
 
         # Catch if a user failed to define a region
@@ -72,22 +208,76 @@ class PetKitClient:
             raise RegionError('A region must be specified in order to log into your PetKit account.')
 
         self.username: str = username
-        self.password: str = password
+        # Only the hashed password is needed to log in, so the plaintext isn't kept
+        self._password_md5: str = hashlib.md5(password.encode('utf-8')).hexdigest()
         self.region: str = region
         self.base_url: str = ''
         self.servers_dict: dict = {}
-        self._session: ClientSession = session if session else ClientSession()
+        self._servers_fetched_at: float | None = None
+        self._session: ClientSession | None = session
+        # Only sessions created by this client are closed by it
+        self._owns_session: bool = session is None
         self.tz: str = get_localzone_name() if timezone is None else timezone
         self.timeout: int = timeout
         self.token: str | None = None
         self.token_expiration: datetime | None = None
+        self._token_refresh_at: datetime | None = None
         self.user_id: str | None = None
         self.ble_sequence: int = 0
         self.manually_paused: dict[int, bool] = {}
         self.manual_pause_end: dict[int, datetime | None] = {}
         self.last_manual_feed_id: dict[int, str | None] = {}
-        self.last_ble_poll: dict[int, datetime | None]  = {}
-        self.group_ids: set[int] = set()
+        # time.monotonic() value of the last successful BLE relay poll per water fountain
+        self.last_ble_poll: dict[int, float]  = {}
+        self.ble_cache_ttl: float = ble_cache_ttl
+        # Water fountain ID -> (time.monotonic() of the BLE relay refresh, W5Fountain)
+        self._fountain_cache: dict[int, tuple[float, W5Fountain]] = {}
+        self.group_ids: tuple[int, ...] = ()
+        self._cached_header: dict[str, str] | None = None
+        self._today_date: date | None = None
+        self._today_str: str = ''
+        # Request bodies that only contain the device ID, reused on every refresh
+        self._id_payloads: dict[tuple[str, int], dict[str, Any]] = {}
+        # Full endpoint URLs keyed by (device type, endpoint), cleared whenever base_url is set
+        self._url_cache: dict[tuple[str | None, Endpoint], str] = {}
+        # Strong references to fire-and-forget tasks so they aren't garbage collected early
+        self._background_tasks: set[asyncio.Task] = set()
+        # Delayed BLE relay disconnects that haven't been sent yet, keyed by bleId
+        self._pending_disconnects: dict[int, asyncio.Task] = {}
+        # (token, tz) the cached header was built from
+        self._cached_header_key: tuple[str | None, str | None] | None = None
+
+    async def __aenter__(self) -> PetKitClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Wait for pending BLE relay disconnects and close the aiohttp session if it was created by this client.
+        This must be called (or the client used as an async context manager) even when a session is passed in,
+        since the disconnects scheduled by get_petkit_data are sent in the background.
+        """
+
+        # Let pending BLE relay disconnects finish before the session goes away
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _ensure_session(self) -> ClientSession:
+        """Return the aiohttp session, creating it on first use so that it
+        is bound to the running event loop. A single session is kept for the
+        lifetime of the client so keep-alive connections to the API are reused.
+        """
+
+        if self._session is None or (self._owns_session and self._session.closed):
+            # Keep idle connections open longer than the typical polling interval so
+            # the TLS connection to the API survives between refreshes
+            connector = TCPConnector(limit=0, limit_per_host=16, keepalive_timeout=90, ttl_dns_cache=300)
+            self._session = ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
 
     async def get_api_server_list(self) -> None:
         """Fetches a list of all api urls categorized by region."""
@@ -111,10 +301,17 @@ class PetKitClient:
                 "id": region["id"],
                 "url": region["gateway"]
             }
+        self._servers_fetched_at = time.monotonic()
 
     async def login(self) -> None:
 
-        await self.get_api_server_list()
+        # The region server list rarely changes so don't fetch it on every re-login
+        if (
+            not self.servers_dict
+            or self._servers_fetched_at is None
+            or time.monotonic() - self._servers_fetched_at >= _SERVER_LIST_TTL
+        ):
+            await self.get_api_server_list()
         # Determine the user's base URL
         if self.region == "China":
             self.base_url = Region.CN
@@ -122,8 +319,9 @@ class PetKitClient:
             self.base_url = self.servers_dict[self.region]["url"]
         else:
             raise RegionError('Region specified is not a valid region.')
+        self._url_cache.clear()
 
-        login_url = f'{self.base_url}{Endpoint.LOGIN}'
+        login_url = self._url(Endpoint.LOGIN)
 
         headers = {
             'Accept': Header.ACCEPT,
@@ -139,7 +337,7 @@ class PetKitClient:
             'client': str(CLIENT_DICT),
             'encrypt': '1',
             'oldVersion': Header.API_VERSION,
-            'password': hashlib.md5(self.password.encode()).hexdigest(),
+            'password': self._password_md5,
             'region': self.servers_dict[self.region]["id"],
             'username': self.username
         }
@@ -150,6 +348,9 @@ class PetKitClient:
         self.user_id = response['result']['session']['userId']
         self.token = response['result']['session']['id']
         self.token_expiration = datetime.now() + timedelta(seconds=response['result']['session']['expiresIn'])
+        # Renew the token once it is within 60 minutes of expiring
+        self._token_refresh_at = self.token_expiration - timedelta(seconds=3600)
+        self._cached_header = None
         ## Obtain all group IDs
         await self.get_group_ids()
 
@@ -158,13 +359,16 @@ class PetKitClient:
         which will be used to grab device rosters.
         """
 
-        families_url = f'{self.base_url}{Endpoint.FAMILY_LIST}'
-        header = await self.create_header()
+        families_url = self._url(Endpoint.FAMILY_LIST)
+        header = self.create_header()
         data = {}
         LOGGER.debug(f'Grabbing group IDs at {families_url}')
         groups = await self._post(families_url, header, data)
+        group_ids = set(self.group_ids)
         for group in groups['result']:
-            self.group_ids.add(group['groupId'])
+            group_ids.add(group['groupId'])
+        # Group IDs are only iterated after this point, so store them as a tuple
+        self.group_ids = tuple(group_ids)
         LOGGER.debug(f'Found the following group IDs: {self.group_ids}')
 
     async def check_token(self) -> None:
@@ -174,18 +378,23 @@ class PetKitClient:
         or has already expired, a new token is obtained.
         """
 
-        current_dt = datetime.now()
-        if (self.token or self.token_expiration) is None:
+        if self.token is None or self.token_expiration is None:
             await self.login()
-        elif (self.token_expiration-current_dt).total_seconds() < 3600:
+        elif datetime.now() >= self._token_refresh_at:
             LOGGER.debug('Token expired. Obtaining new token.')
             await self.login()
         else:
             return None
 
-    async def create_header(self) -> dict[str, str]:
-        """Create header for interaction with devices."""
+    def create_header(self) -> dict[str, str]:
+        """Create header for interaction with devices.
+        The header only changes when the session token or timezone does,
+        so it is cached and rebuilt only when either of them changes.
+        """
 
+        key = (self.token, self.tz)
+        if self._cached_header is not None and self._cached_header_key == key:
+            return self._cached_header
         if self.tz is None:
             raise TimezoneError("Unable to find the TZ environmental variable on the OS")
         header = {
@@ -200,149 +409,202 @@ class PetKitClient:
             'X-Client': Header.CLIENT,
             'X-TimezoneId': self.tz,
         }
+        self._cached_header = header
+        self._cached_header_key = key
         return header
 
-    async def get_device_rosters(self) -> dict[int, Any]:
-        """Fetch device roster endpoint to get all available devices."""
+    def _today_yyyymmdd(self) -> str:
+        """Return today's date formatted as YYYYMMDD, reformatting it only when the day changes."""
+
+        today = date.today()
+        if today != self._today_date:
+            self._today_date = today
+            self._today_str = today.strftime('%Y%m%d')
+        return self._today_str
+
+    def _url(self, endpoint: Endpoint, device_type: str | None = None) -> str:
+        """Return the full URL for an endpoint, optionally prefixed with a device type."""
+
+        key = (device_type, endpoint)
+        url = self._url_cache.get(key)
+        if url is None:
+            if device_type is None:
+                url = f'{self.base_url}{endpoint}'
+            else:
+                url = f'{self.base_url}{device_type}/{endpoint}'
+            self._url_cache[key] = url
+        return url
+
+    def _feeder_url(self, feeder_type: str, action: str) -> str:
+        """Return the URL for a feeder action, accounting for feeders with their own endpoints."""
+
+        endpoint, overrides = _FEEDER_ENDPOINTS[action]
+        endpoint, typed = overrides.get(feeder_type, (endpoint, True))
+        return self._url(endpoint, feeder_type if typed else None)
+
+    def _id_payload(self, device_id: int, key: str = 'id') -> dict[str, Any]:
+        """Return the {key: device_id} request body for a device, building it only once."""
+
+        cache_key = (key, device_id)
+        payload = self._id_payloads.get(cache_key)
+        if payload is None:
+            payload = self._id_payloads[cache_key] = {key: device_id}
+        return payload
+
+    async def get_device_rosters(self, day: str | None = None) -> dict[int, Any]:
+        """Fetch device roster endpoint to get all available devices.
+
+        day: Date formatted as YYYYMMDD or None to use today's date
+        """
 
         await self.check_token()
-        url = f'{self.base_url}{Endpoint.DEVICE_ROSTER}'
-        header = await self.create_header()
-        device_rosters = {}
+        url = self._url(Endpoint.DEVICE_ROSTER)
+        header = self.create_header()
+        if day is None:
+            day = self._today_yyyymmdd()
+        group_ids = self.group_ids
         LOGGER.debug(f'Fetching device rosters at {url}')
-        for group_id in self.group_ids:
-            data = {
-                'day': str(datetime.now().date()).replace('-', ''),
-                'groupId': group_id
-            }
-            device_roster = await self._post(url, header, data)
-            device_rosters[group_id] = device_roster
-        LOGGER.debug(
-            f'Found the following device rosters:\n'
-            f'{json.dumps(device_rosters, indent=4)}'
-        )
+        # Rosters for each group are independent of each other so fetch them concurrently
+        rosters = await asyncio.gather(*(
+            self._post(url, header, {'day': day, 'groupId': group_id}) for group_id in group_ids
+        ))
+        device_rosters = dict(zip(group_ids, rosters))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Found the following device rosters:\n%s', _pretty_json(device_rosters))
         return device_rosters
 
     async def get_petkit_data(self) -> PetKitData:
         """Fetch data for all PetKit devices."""
 
-        device_rosters = await self.get_device_rosters()
-        fountains_data: dict[int, W5Fountain] = {}
-        feeders_data: dict[int, Feeder] = {}
-        litter_boxes_data: dict[int, LitterBox] = {}
-        purifiers_data: dict[int, Purifier] = {}
-        header = await self.create_header()
+        # The same date is used by every request made during this refresh
+        today = self._today_yyyymmdd()
+        device_rosters = await self.get_device_rosters(day=today)
+        devices_data: dict[str, dict[int, Any]] = {
+            'feeders': {},
+            'litter_boxes': {},
+            'purifiers': {},
+            'water_fountains': {},
+        }
+        header = self.create_header()
+        # Coroutines for every device other than water fountains, and the category each belongs to
+        device_tasks: list = []
+        task_categories: list[str] = []
+        # Water fountains share the BLE relay and ble_sequence, so they are handled one at a time
+        fountains: list[tuple[dict[str, Any], bool]] = []
 
         for group_id in device_rosters:
             device_roster = device_rosters[group_id]
-            LOGGER.debug(
-                f'Parsing device roster for group ID {group_id}:\n'
-                f'{json.dumps(device_roster, indent = 4)}'
-            )
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('Parsing device roster for group ID %s:\n%s', group_id, _pretty_json(device_roster))
             group_has_relay: bool = False
             if 'hasRelay' in device_roster['result']:
                 group_has_relay = device_roster['result']['hasRelay']
 
             devices = device_roster['result']['devices']
-            LOGGER.debug(
-                f'Found the following PetKit devices in family:\n'
-                f'{json.dumps(devices, indent = 4)}'
-            )
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('Found the following PetKit devices in family:\n%s', _pretty_json(devices))
             if devices:
                 for device in devices:
+                    category = _DEVICE_CATEGORY.get(device['type'])
                     # W5 Water Fountain
-                    if device['type'] in WATER_FOUNTAIN_LIST:
-                        wf_instance, wf_id = await self._handle_water_fountain(device=device, has_relay=group_has_relay, header=header)
-                        fountains_data[wf_id] = wf_instance
-
+                    if category == 'water_fountains':
+                        fountains.append((device, group_has_relay))
+                        continue
                     # Feeders
-                    if device['type'] in FEEDER_LIST:
-                        feeder_instance, feeder_id = await self._handle_feeder(device=device, header=header)
-                        feeders_data[feeder_id] = feeder_instance
-
+                    elif category == 'feeders':
+                        device_task = self._handle_feeder(device=device, header=header)
                     # Litter Boxes
-                    if device['type'] in LITTER_LIST:
-                        litter_box_instance, litter_box_id = await self._handle_litter_box(device=device, header=header)
-                        litter_boxes_data[litter_box_id] = litter_box_instance
-
+                    elif category == 'litter_boxes':
+                        device_task = self._handle_litter_box(device=device, header=header, today=today)
                     # Purifiers
-                    if device['type'] in PURIFIER_LIST:
-                        purifier_instance, purifier_id = await self._handle_purifier(device=device, header=header)
-                        purifiers_data[purifier_id] = purifier_instance
-
-        # Pets
-        pets_data = await self._handle_pets(header=header)
+                    elif category == 'purifiers':
+                        device_task = self._handle_purifier(device=device, header=header)
+                    else:
+                        continue
+                    device_tasks.append(device_task)
+                    task_categories.append(category)
+
+        # Fetch pets, water fountains, and all other devices concurrently
+        pets_data, fountain_results, *device_results = await asyncio.gather(
+            self._handle_pets(header=header),
+            self._handle_water_fountains(fountains=fountains, header=header),
+            *device_tasks,
+        )
+        for instance, device_id in fountain_results:
+            devices_data['water_fountains'][device_id] = instance
+        for category, (instance, device_id) in zip(task_categories, device_results):
+            devices_data[category][device_id] = instance
         LOGGER.debug('PetKitData instance creation successful')
         return PetKitData(
             user_id=self.user_id,
-            feeders=feeders_data,
-            litter_boxes=litter_boxes_data,
-            water_fountains=fountains_data,
             pets=pets_data,
-            purifiers=purifiers_data
+            **devices_data
         )
 
+    async def _handle_water_fountains(
+        self, fountains: list[tuple[dict[str, Any], bool]], header: dict[str, str]
+    ) -> list[tuple[W5Fountain, int]]:
+        """Handle water fountains sequentially since they share the BLE relay connection and sequence."""
+
+        results = []
+        for device, has_relay in fountains:
+            results.append(await self._handle_water_fountain(device=device, has_relay=has_relay, header=header))
+        return results
+
     async def _handle_water_fountain(self, device: dict[str, Any], has_relay: bool, header: dict[str, str]) -> (W5Fountain, int):
         """Handle parsing water fountain and initiating BLE relay connection."""
 
-        device_type: str = device['type'].lower()
-        fountain_data: dict[str, Any] = {}
+        if self.ble_cache_ttl > 0:
+            cached = self._fountain_cache.get(device['id'])
+            if cached is not None and time.monotonic() - cached[0] < self.ble_cache_ttl:
+                LOGGER.debug(f'Using cached data for water fountain({device["id"]})')
+                return cached[1], device['id']
+
+        device_type: str = _DEVICE_TYPE_LOWER[device['type']]
+        ble_refreshed: bool = False
+        # Only set by the BLE relay path. Every other path falls through to a single
+        # fetch of the latest data available from the API at the end.
+        fountain_data: dict[str, Any] | None = None
         relay_tc: int = 14
-        wf_url = f'{self.base_url}{Endpoint.W5}'
-        data = {
-            'id': device['id']
-        }
+        wf_url = self._url(Endpoint.W5)
+        data = self._id_payload(device['id'])
 
         if has_relay:
-            current_dt = datetime.now()
             ### Only initiate BLE relay if 7 minutes have elapsed since the last time the relay was initiated.
             ### This helps prevent some devices, such as the Pura Max, from locking up (i.e., doesn't
             ### automatically cycle after cat usage) if they are asked to initiate the BLE relay too frequently.
+            ### A monotonic clock is used so that wall clock changes (NTP, DST) don't affect the wait.
             can_poll: bool = False
+            elapsed: float = 0.0
             if device['id'] not in self.last_ble_poll:
                 can_poll = True
             else:
+                elapsed = time.monotonic() - self.last_ble_poll[device['id']]
                 LOGGER.debug(
                     f'Water fountain({device["id"]}) - Last successful BLE '
-                    f'relay polling: {self.last_ble_poll[device["id"]]}'
+                    f'relay polling: {elapsed:.0f} seconds ago'
                 )
-                if (current_dt-self.last_ble_poll[device['id']]).total_seconds() >= 420:
-                    can_poll = True
-                else:
-                    can_poll = False
+                can_poll = elapsed >= 420
             if can_poll:
                 LOGGER.debug(f'Polling water fountain({device["id"]}) via BLE relay')
-                ble_connect_attempt: int = 1
-                ble_poll_attempt: int = 1
                 main_online: bool = False
-                ble_url = f'{self.base_url}{Endpoint.BLE_DEVICES}'
-                conn_url = f'{self.base_url}{Endpoint.BLE_CONNECT}'
-                poll_url = f'{self.base_url}{Endpoint.BLE_POLL}'
-                disconnect_url = f'{self.base_url}{Endpoint.BLE_CANCEL}'
+                ble_url = self._url(Endpoint.BLE_DEVICES)
+                conn_url = self._url(Endpoint.BLE_CONNECT)
+                poll_url = self._url(Endpoint.BLE_POLL)
+                disconnect_url = self._url(Endpoint.BLE_CANCEL)
                 LOGGER.debug('Fetching associated relay devices')
                 relay_devices = await self._post(ble_url, header, data={'groupId': device['groupId'],})
-                LOGGER.debug(
-                    f'Associated relay devices response:\n'
-                    f'{json.dumps(relay_devices, indent = 4)}'
-                )
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug('Associated relay devices response:\n%s', _pretty_json(relay_devices))
                 if relay_devices['result']:
-                    ble_available = True
-                    for relay_device in relay_devices['result']:
-                        if relay_device['pim'] == 1:
-                            LOGGER.debug('Main relay device online')
-                            main_online = True
-                            break
-                        else:
-                            LOGGER.debug('Main relay device not online')
-                            main_online = False
+                    main_online = any(relay_device.get('pim') == 1 for relay_device in relay_devices['result'])
+                    LOGGER.debug(f'Main relay device online: {main_online}')
 
-                    if ble_available and main_online:
+                    if main_online:
                         LOGGER.debug(f'Fetching water fountain({device["id"]}) details page at {wf_url}')
                         device_details = await self._post(wf_url, header, data)
-                        LOGGER.debug(
-                            f'Device details response:\n'
-                            f'{json.dumps(device_details, indent = 4)}'
-                        )
+                        if LOGGER.isEnabledFor(logging.DEBUG):
+                            LOGGER.debug('Device details response:\n%s', _pretty_json(device_details))
                         mac = device_details['result']['mac']
                         ble_data = {
                             'bleId': device_details['result']['id'],
@@ -353,13 +615,14 @@ class PetKitClient:
                             f'Starting BLE relay connection for {device_details["result"]["name"]}'
                             f'({device_details["result"]["id"]})'
                         )
-                        conn_success = await self.start_ble_connection(conn_url, header, ble_data, ble_connect_attempt)
+                        await self._settle_ble_disconnects(ble_data['bleId'])
+                        conn_success = await self.start_ble_connection(conn_url, header, ble_data)
                         if conn_success:
                             LOGGER.debug(
                                 f'BLE relay connection successful for {device_details["result"]["name"]}. '
                                 f'Attempting to poll the device now.'
                             )
-                            poll_success = await self.poll_ble_connection(poll_url, header, ble_data, ble_poll_attempt)
+                            poll_success = await self.poll_ble_connection(poll_url, header, ble_data)
                             if poll_success:
                                 LOGGER.debug(
                                     f'BLE relay polling successful for {device_details["result"]["name"]}. '
@@ -373,76 +636,56 @@ class PetKitClient:
                                     self.ble_sequence = 0
                                 self.ble_sequence += 1
                                 try:
-                                    await self.initial_ble_commands(device_details, relay_tc)
+                                    await self.initial_ble_commands(device_details, relay_tc, header)
                                 except BluetoothError:
                                     pass
                                 finally:
                                     # Remember last time BLE relay was successfully initiated
-                                    self.last_ble_poll[device['id']] = datetime.now()
+                                    self.last_ble_poll[device['id']] = time.monotonic()
                                     LOGGER.debug(
                                         f'Fetching data for {device_details["result"]["name"]} '
                                         f'at {wf_url}'
                                     )
                                     fountain_data = await self._post(wf_url, header, data)
-                                    LOGGER.debug(
-                                        f'Water fountain data response:\n'
-                                        f'{json.dumps(fountain_data, indent = 4)}'
-                                    )
+                                    self._log_wf_response(fountain_data)
+                                    ble_refreshed = True
                                     # Make sure to sever the BLE connection after getting updated data
-                                    await asyncio.sleep(2)
                                     LOGGER.debug(
                                         f'Disconnecting from relay for water fountain '
                                         f'{device_details["result"]["name"]}'
                                     )
-                                    await self._post(disconnect_url, header, ble_data)
+                                    self._schedule_ble_disconnect(disconnect_url, header, ble_data)
                             else:
                                 LOGGER.warning(
                                     f'BLE polling to {device_details["result"]["name"]} failed after 4 attempts. Will try again during next refresh.'
                                 )
                                 # Sever the BLE relay connection if polling attempts fail
-                                await asyncio.sleep(2)
                                 LOGGER.debug(
                                     f'Disconnecting from relay for water fountain '
                                     f'{device_details["result"]["name"]}'
                                 )
-                                await self._post(disconnect_url, header, ble_data)
+                                self._schedule_ble_disconnect(disconnect_url, header, ble_data)
                                 fountain_data = device_details
                         else:
                             LOGGER.warning(
                                 f'BLE connection to {device_details["result"]["name"]} failed after 4 attempts. Will try again during next refresh.'
                             )
                             fountain_data = device_details
-
-                    if not main_online:
+                    else:
                         LOGGER.warning(
-                            f'Unable to use BLE relay: Main relay device is reported as being offline. Fetching latest available data.'
-                        )
-                        fountain_data = await self._post(wf_url, header, data)
-                        LOGGER.debug(
-                            f'Water fountain data response:\n'
-                            f'{json.dumps(fountain_data, indent=4)}'
+                            'Unable to use BLE relay: Main relay device is reported as being offline. Fetching latest available data.'
                         )
                 else:
                     LOGGER.debug(
                         'No associated relay devices found in response. Fetching latest data available from API.'
                     )
-                    fountain_data = await self._post(wf_url, header, data)
-                    LOGGER.debug(
-                        f'Water fountain data response:\n'
-                        f'{json.dumps(fountain_data, indent=4)}'
-                    )
             else:
                 LOGGER.debug(
                     f'Too early to poll again via BLE relay.\n'
-                    f'Last Poll: {self.last_ble_poll[device["id"]]}\n'
-                    f'Next Poll: {self.last_ble_poll[device["id"]] + timedelta(seconds=420)}\n'
+                    f'Last Poll: {elapsed:.0f} seconds ago\n'
+                    f'Next Poll: in {420 - elapsed:.0f} seconds\n'
                     f'Fetching latest data available from API.'
                 )
-                fountain_data = await self._post(wf_url, header, data)
-                LOGGER.debug(
-                    f'Water fountain data response:\n'
-                    f'{json.dumps(fountain_data, indent=4)}'
-                )
         else:
             LOGGER.warning(
                 f'PetKit servers are reporting no PetKit device exists that can act as the BLE relay '
@@ -457,11 +700,11 @@ class PetKitClient:
                 f'       BLE relay or PetKit app (direct bluetooth connection) was used.'
             )
             LOGGER.debug('Fetching latest data available from API.')
+
+        if fountain_data is None:
+            LOGGER.debug(f'Fetching data for water fountain({device["id"]}) at {wf_url}')
             fountain_data = await self._post(wf_url, header, data)
-            LOGGER.debug(
-                f'Water fountain data response:\n'
-                f'{json.dumps(fountain_data, indent=4)}'
-            )
+            self._log_wf_response(fountain_data)
         wf_instance = W5Fountain(
             id=fountain_data['result']['id'],
             data=fountain_data['result'],
@@ -469,48 +712,97 @@ class PetKitClient:
             group_relay=has_relay,
             ble_relay=relay_tc,
         )
+        if ble_refreshed and self.ble_cache_ttl > 0:
+            self._fountain_cache[device['id']] = (time.monotonic(), wf_instance)
         return wf_instance, fountain_data['result']['id']
 
+    def _schedule_ble_disconnect(self, disconnect_url: str, header: dict[str, str], ble_data: dict[str, Any]) -> None:
+        """Sever the BLE relay connection in the background so callers don't wait on it."""
+
+        ble_id = ble_data['bleId']
+        task = asyncio.ensure_future(self._ble_disconnect(disconnect_url, header, ble_data))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        self._pending_disconnects[ble_id] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if self._pending_disconnects.get(ble_id) is done:
+                del self._pending_disconnects[ble_id]
+
+        task.add_done_callback(_forget)
+
+    async def _settle_ble_disconnects(self, ble_id: int) -> None:
+        """Make sure a delayed disconnect can't sever a BLE relay connection that is about to be opened.
+
+        A pending disconnect for the same water fountain is dropped since the new connection supersedes it.
+        Pending disconnects for other water fountains are sent before connecting so they can't tear down
+        the relay session of this one.
+        """
+
+        for pending_id, task in list(self._pending_disconnects.items()):
+            if pending_id == ble_id:
+                task.cancel()
+                del self._pending_disconnects[pending_id]
+        if self._pending_disconnects:
+            await asyncio.gather(*self._pending_disconnects.values(), return_exceptions=True)
+
+    async def _ble_disconnect(self, disconnect_url: str, header: dict[str, str], ble_data: dict[str, Any]) -> None:
+        """Wait for the relay to finish up and then sever the BLE relay connection."""
+
+        await asyncio.sleep(2)
+        try:
+            await self._post(disconnect_url, header, ble_data)
+        except asyncio.CancelledError:
+            # CancelledError is an Exception subclass on Python 3.7
+            raise
+        except Exception as error:
+            LOGGER.warning(f'Failed to disconnect from BLE relay: {error}')
+
+    @staticmethod
+    def _log_wf_response(fountain_data: dict[str, Any]) -> None:
+        """Log water fountain data response if debug logging is enabled."""
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Water fountain data response:\n%s', _pretty_json(fountain_data))
+
     async def _handle_feeder(self, device: dict[str, Any], header: dict[str, str]) -> (Feeder, int):
         """Handle parsing feeder data."""
 
         sound_list: dict[int, str] = {}
-        device_type_lower = device["type"].lower()
-        feeder_url = f'{self.base_url}{device_type_lower}/{Endpoint.DEVICE_DETAIL}'
-        data = {
-            'id': device['id']
-        }
+        device_type_lower = _DEVICE_TYPE_LOWER[device['type']]
+        feeder_url = self._url(Endpoint.DEVICE_DETAIL, device_type_lower)
+        data = self._id_payload(device['id'])
         LOGGER.debug(
             f'Fetching data for feeder({device["id"]}) at {feeder_url}'
         )
-        feeder_data = await self._post(feeder_url, header, data)
-        LOGGER.debug(
-            f' Feeder data response:\n'
-            f'{json.dumps(feeder_data, indent=4)}'
-        )
-        # Populate the last manual feeding ID for the Gemini(d4s) feeder if it exists
-        if feeder_data['result']['id'] in self.last_manual_feed_id:
-            last_manual_feed_id = self.last_manual_feed_id[feeder_data['result']['id']]
-        else:
-            last_manual_feed_id = None
-
         if device['type'] in ['D3']:
             sound_list[-1] = 'Default'
-            sound_url = f'{self.base_url}{device_type_lower}/{Endpoint.SOUND_LIST}'
+            sound_url = self._url(Endpoint.SOUND_LIST, device_type_lower)
             sound_data = {
                 'deviceId': device['id']
             }
             LOGGER.debug(
-                f'Fetching sound list for {feeder_data["result"]["name"]} at {feeder_url}'
+                f'Fetching sound list for feeder({device["id"]}) at {sound_url}'
             )
-            sound_response = await self._post(sound_url, header, sound_data)
-            LOGGER.debug(
-                f'Sound data response:\n'
-                f'{json.dumps(sound_response, indent=4)}'
+            # The sound list only needs the device ID so fetch it alongside the feeder data
+            feeder_data, sound_response = await asyncio.gather(
+                self._post(feeder_url, header, data),
+                self._post(sound_url, header, sound_data),
             )
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('Sound data response:\n%s', _pretty_json(sound_response))
             result = sound_response['result']
             for sound in result:
                 sound_list[sound['id']] = sound['name']
+        else:
+            feeder_data = await self._post(feeder_url, header, data)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Feeder data response:\n%s', _pretty_json(feeder_data))
+        # Populate the last manual feeding ID for the Gemini(d4s) feeder if it exists
+        if feeder_data['result']['id'] in self.last_manual_feed_id:
+            last_manual_feed_id = self.last_manual_feed_id[feeder_data['result']['id']]
+        else:
+            last_manual_feed_id = None
 
         feeder_instance = Feeder(
             id=feeder_data['result']['id'],
@@ -521,64 +813,53 @@ class PetKitClient:
         )
         return feeder_instance, feeder_data['result']['id']
 
-    async def _handle_litter_box(self, device: dict[str, Any], header: dict[str, str]) -> (LitterBox, int):
+    async def _handle_litter_box(self, device: dict[str, Any], header: dict[str, str], today: str) -> (LitterBox, int):
         """Handle parsing litter box data."""
 
-        ### Fetch device_detail page
-        device_type_lower = device["type"].lower()
-        dd_url = f'{self.base_url}{device_type_lower}/{Endpoint.DEVICE_DETAIL}'
-        dd_data = {
-            'id': device['id']
-        }
-        LOGGER.debug(
-            f'Fetching litter box({device["id"]}) device details page at {dd_url}'
-        )
-        device_detail = await self._post(dd_url, header, dd_data)
-        LOGGER.debug(
-            f'Litter box data response:\n'
-            f'{json.dumps(device_detail, indent=4)}'
-        )
+        ### device_detail page
+        device_type_lower = _DEVICE_TYPE_LOWER[device['type']]
+        dd_url = self._url(Endpoint.DEVICE_DETAIL, device_type_lower)
+        dd_data = self._id_payload(device['id'])
 
-        ### Fetch DeviceRecord page
-        dr_url = f'{self.base_url}{device_type_lower}/{Endpoint.DEVICE_RECORD}'
+        ### DeviceRecord page
+        dr_url = self._url(Endpoint.DEVICE_RECORD, device_type_lower)
         if device['type'] == 'T4':
             date_key = 'date'
         else:
             date_key = 'day'
         dr_data = {
-            date_key: str(datetime.now().date()).replace('-', ''),
+            date_key: today,
             'deviceId': device['id']
         }
-        LOGGER.debug(
-            f'Fetching litter box({device["id"]}) device record page at {dr_url}'
-        )
-        device_record = await self._post(dr_url, header, dr_data)
-        LOGGER.debug(
-            f'Litter box record response:\n'
-            f'{json.dumps(device_record, indent=4)}'
-        )
 
-        ### Fetch statistic page
-        stat_url = f'{self.base_url}{device_type_lower}/{Endpoint.STATISTIC}'
+        ### Statistic page
+        stat_url = self._url(Endpoint.STATISTIC, device_type_lower)
         stat_data = {
             'deviceId': device['id'],
-            'endDate': str(datetime.now().date()).replace('-', ''),
-            'startDate': str(datetime.now().date()).replace('-', ''),
+            'endDate': today,
+            'startDate': today,
             'type': 0
         }
+
+        ### The three pages don't depend on each other so fetch them concurrently
         LOGGER.debug(
-            f'Fetching litter box({device["id"]}) statistics page at {stat_url}'
+            f'Fetching litter box({device["id"]}) device details page at {dd_url}, '
+            f'device record page at {dr_url} and statistics page at {stat_url}'
         )
-        device_stats = await self._post(stat_url, header, stat_data)
-        LOGGER.debug(
-            f'Litter box statistics response:\n'
-            f'{json.dumps(device_stats, indent=4)}'
+        device_detail, device_record, device_stats = await asyncio.gather(
+            self._post(dd_url, header, dd_data),
+            self._post(dr_url, header, dr_data),
+            self._post(stat_url, header, stat_data),
         )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Litter box data response:\n%s', _pretty_json(device_detail))
+            LOGGER.debug('Litter box record response:\n%s', _pretty_json(device_record))
+            LOGGER.debug('Litter box statistics response:\n%s', _pretty_json(device_stats))
 
         if device_detail['result']['id'] in self.manually_paused:
             # Check to see if manual pause is currently True
             if self.manually_paused[device_detail['result']['id']]:
-                await self.check_manual_pause_expiration(device_detail['result']['id'])
+                self.check_manual_pause_expiration(device_detail['result']['id'])
                 manually_paused = self.manually_paused[device_detail['result']['id']]
                 LOGGER.debug(
                     f'Litter box({device["id"]}) manual pause state: {manually_paused}'
@@ -622,19 +903,15 @@ class PetKitClient:
         """Handle parsing purifier data."""
 
         ### Fetch device_detail page
-        device_type_lower = device["type"].lower()
-        dd_url = f'{self.base_url}{device_type_lower}/{Endpoint.DEVICE_DETAIL}'
-        dd_data = {
-            'id': device['id']
-        }
+        device_type_lower = _DEVICE_TYPE_LOWER[device['type']]
+        dd_url = self._url(Endpoint.DEVICE_DETAIL, device_type_lower)
+        dd_data = self._id_payload(device['id'])
         LOGGER.debug(
             f'Fetching purifier({device["id"]}) device details page at {dd_url}'
         )
         device_detail = await self._post(dd_url, header, dd_data)
-        LOGGER.debug(
-            f'Purifier data response:\n'
-            f'{json.dumps(device_detail, indent=4)}'
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Purifier data response:\n%s', _pretty_json(device_detail))
 
         ### Create Purifier Object ###
         purifier_instance = Purifier(
@@ -649,7 +926,7 @@ class PetKitClient:
 
         pets_data: dict[int, Pet] = {}
         ### Get user details page
-        details_url = f'{self.base_url}{Endpoint.USER_DETAILS}'
+        details_url = self._url(Endpoint.USER_DETAILS)
         details_data = {
             'userId': self.user_id
         }
@@ -659,8 +936,10 @@ class PetKitClient:
         if user_pets:
             for pet in user_pets:
                 ### Create Pet Object
-                pets_data[int(pet['id'])] = Pet(
-                    id=pet['id'],
+                # The API may return the ID as a string, so convert it once here to match Pet.id
+                pet_id = int(pet['id'])
+                pets_data[pet_id] = Pet(
+                    id=pet_id,
                     data=pet,
                     type=pet['type']['name']
                 )
@@ -669,19 +948,26 @@ class PetKitClient:
     async def _post(self, url: str, headers: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
         """Make POST API call."""
 
-        async with self._session.post(url, headers=headers, data=data, timeout=self.timeout) as resp:
+        session = await self._ensure_session()
+        # Every header sets Content-Type to form-urlencoded, so the body can be sent as pre-encoded bytes
+        body = _form_body(data)
+        # Bound connection setup separately so an unreachable host fails fast
+        timeout = ClientTimeout(total=self.timeout, sock_connect=5, sock_read=self.timeout)
+        async with session.post(url, headers=headers, data=body, timeout=timeout) as resp:
             return await self._response(resp)
 
     @staticmethod
     async def _response(resp: ClientResponse) -> dict[str, Any]:
         """Return response from API call."""
 
-#        if resp.status != 200:
-#            error = await resp.text()
-#            raise PetKitError(f'PetKit API Error Encountered. Status: {resp.status}; Error: {error}')
+        body = await resp.read()
         try:
-            response: dict[str, Any] = await resp.json()
+            response: dict[str, Any] = _json_loads(body)
         except Exception as error:
+            if resp.status >= 400:
+                # Error pages are often HTML, so report the status along with the start of the body
+                text = body.decode(errors='replace')
+                raise PetKitError(f'PetKit API Error Encountered. Status: {resp.status}; Error: {text[:512]}') from error
             raise PetKitError(f'Could not return json {error}') from error
         if 'error' in response:
             code = response['error']['code']
@@ -693,70 +979,54 @@ class PetKitClient:
                 raise BluetoothError(f'{BLUETOOTH_ERRORS[code]}')
             else:
                 raise PetKitError(f'PetKit Error {code}: {response["error"]["msg"]}')
+        if resp.status >= 400:
+            raise PetKitError(f'PetKit API Error Encountered. Status: {resp.status}; Error: {body[:512].decode(errors="replace")}')
         return response
 
 
 # <--------------------------------------- Methods for controlling devices --------------------------------------->
 
 
-    async def start_ble_connection(self, conn_url: str, header: dict[str, Any], ble_data: dict[str, Any], ble_connect_attempt: int) -> bool:
+    async def start_ble_connection(self, conn_url: str, header: dict[str, Any], ble_data: dict[str, Any]) -> bool:
         """Used to initiate the BLE relay connection."""
 
         # Stop trying to connect via BLE relay after 4 attempts
-        if ble_connect_attempt > 4:
-            LOGGER.debug(
-                f'BLE connection attempt count: {ble_connect_attempt}. Connection unsuccessful.'
-            )
-            conn_success = False
-            return conn_success
-        else:
+        for ble_connect_attempt in range(1, 5):
             conn_resp = await self._post(conn_url, header, ble_data)
-            LOGGER.debug(
-                f'BLE connection attempt {ble_connect_attempt} response:\n'
-                f'{json.dumps(conn_resp, indent=4)}'
-            )
-            # State should be 1 if connection was successful 
-            if conn_resp['result']['state'] != 1:
-                LOGGER.debug('BLE connection attempt failed.')
-                ble_connect_attempt += 1
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('BLE connection attempt %s response:\n%s', ble_connect_attempt, _pretty_json(conn_resp))
+            # State should be 1 if connection was successful
+            if conn_resp['result']['state'] == 1:
+                return True
+            LOGGER.debug('BLE connection attempt failed.')
+            if ble_connect_attempt < 4:
                 await asyncio.sleep(3)
-                await self.start_ble_connection(conn_url, header, ble_data, ble_connect_attempt)
-            else:
-                conn_success = True
-                return conn_success
+        LOGGER.debug('BLE connection unsuccessful after 4 attempts.')
+        return False
 
-    async def poll_ble_connection(self, poll_url: str, header: dict[str, Any], ble_data: dict[str, Any], ble_poll_attempt: int) -> bool:
+    async def poll_ble_connection(self, poll_url: str, header: dict[str, Any], ble_data: dict[str, Any]) -> bool:
         """Initiate polling via the BLE relay and attempt again if it fails."""
 
         # Stop trying to poll via BLE relay after 4 attempts
-        if ble_poll_attempt > 4:
-            LOGGER.debug(
-                f'BLE polling attempt count: {ble_poll_attempt}. Polling unsuccessful.'
-            )
-            poll_success = False
-            return poll_success
-        else:
+        for ble_poll_attempt in range(1, 5):
             poll_resp = await self._post(poll_url, header, ble_data)
-            LOGGER.debug(
-                f'BLE polling attempt {ble_poll_attempt} response:\n'
-                f'{json.dumps(poll_resp, indent=4)}'
-            )
-            # Result should be 0 if polling was successful 
-            if poll_resp['result'] != 0:
-                LOGGER.debug('BLE polling attempt failed.')
-                ble_poll_attempt += 1
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('BLE polling attempt %s response:\n%s', ble_poll_attempt, _pretty_json(poll_resp))
+            # Result should be 0 if polling was successful
+            if poll_resp['result'] == 0:
+                return True
+            LOGGER.debug('BLE polling attempt failed.')
+            if ble_poll_attempt < 4:
                 await asyncio.sleep(3)
-                await self.poll_ble_connection(poll_url, header, ble_data, ble_poll_attempt)
-            else:
-                poll_success = True
-                return poll_success
-        
-    
-    async def initial_ble_commands(self, device: dict[str, Any], relay_type: int) -> None:
+        LOGGER.debug('BLE polling unsuccessful after 4 attempts.')
+        return False
+
+    async def initial_ble_commands(self, device: dict[str, Any], relay_type: int, header: dict[str, str] | None = None) -> None:
         """We have to make two calls to get updated date from the water fountain."""
-        command_url = f'{self.base_url}{Endpoint.CONTROL_WF}'
-        header = await self.create_header()
-        data1 = await self.create_ble_data(W5Command.FIRST_BLE_CMND)
+        command_url = self._url(Endpoint.CONTROL_WF)
+        if header is None:
+            header = self.create_header()
+        data1 = self.create_ble_data(W5Command.FIRST_BLE_CMND)
         first_command = {
             'bleId': device['result']['id'],
             'cmd': '215',
@@ -767,7 +1037,7 @@ class PetKitClient:
         await self._post(command_url, header, first_command)
         self.ble_sequence += 1
 
-        data2 = await self.create_ble_data(W5Command.SECOND_BLE_CMND)
+        data2 = self.create_ble_data(W5Command.SECOND_BLE_CMND)
         second_command = {
             'bleId': device['result']['id'],
             'cmd': '216',
@@ -778,146 +1048,107 @@ class PetKitClient:
         await self._post(command_url, header, second_command)
         self.ble_sequence += 1
 
-
-    async def create_ble_data(self, command: W5Command, device: W5Fountain | None = None) -> str:
+    def create_ble_data(self, command: W5Command, device: W5Fountain | None = None) -> str:
         """Create URL encoded data from specific byte array."""
 
-        byte_list: list = []
-        if command == W5Command.FIRST_BLE_CMND:
-            byte_list = [-6, -4, -3, -41, 1, self.ble_sequence, 0, 0, -5]
-        if command == W5Command.SECOND_BLE_CMND:
-            byte_list = [-6, -4, -3, -40, 1, self.ble_sequence, 0, 0, -5]
-        if command == W5Command.NORMAL_TO_PAUSE:
-            byte_list = [-6, -4, -3, -36, 1, self.ble_sequence, 2, 0, 0, 1, -5]
-        if command == W5Command.SMART_TO_PAUSE:
-            byte_list = [-6, -4, -3, -36, 1, self.ble_sequence, 2, 0, 0, 2, -5]
-        if command == W5Command.NORMAL:
-            byte_list = [-6, -4, -3, -36, 1, self.ble_sequence, 2, 0, 1, 1, -5]
-        if command == W5Command.SMART:
-            byte_list = [-6, -4, -3, -36, 1, self.ble_sequence, 2, 0, 1, 2, -5]
-
-        if command == W5Command.LIGHT_OFF:
-            # byte_list example = [-6, -4, -3, -35, 1, self.ble_sequence, 13, 0, 3, 3, 0, light_brightness, 0, 0, 0, 0, 0, 5, 40, 1, 104, -5]
-            data_list = await self.w5_command_data_creator(device=device, command=command, setting=[0])
-            byte_list = await self.create_ble_byte_list(command=-35, data_list=data_list)
-
-        if command == W5Command.LIGHT_ON:
-            data_list = await self.w5_command_data_creator(device=device, command=command, setting=[1])
-            byte_list = await self.create_ble_byte_list(command=-35, data_list=data_list)
-
-        if command == W5Command.LIGHT_LOW:
-            data_list = await self.w5_command_data_creator(device=device, command=command, setting=[1])
-            byte_list = await self.create_ble_byte_list(command=-35, data_list=data_list)
-
-        if command == W5Command.LIGHT_MEDIUM:
-            data_list = await self.w5_command_data_creator(device=device, command=command, setting=[2])
-            byte_list = await self.create_ble_byte_list(command=-35, data_list=data_list)
-
-        if command == W5Command.LIGHT_HIGH:
-            data_list = await self.w5_command_data_creator(device=device, command=command, setting=[3])
-            byte_list = await self.create_ble_byte_list(command=-35, data_list=data_list)
-
-        if command == W5Command.DO_NOT_DISTURB:
-            data_list = await self.w5_command_data_creator(device=device, command=command, setting=[1])
-            byte_list = await self.create_ble_byte_list(command=-35, data_list=data_list)
-
-        if command == W5Command.DO_NOT_DISTURB_OFF:
-            data_list = await self.w5_command_data_creator(device=device, command=command, setting=[0])
-            byte_list = await self.create_ble_byte_list(command=-35, data_list=data_list)
-
-        if command == W5Command.RESET_FILTER:
-            byte_list = [-6, -4, -3, -34, 1, self.ble_sequence, 0, 0, -5]
-
-        byte_array = bytearray([x % 256 for x in byte_list])
-        b64_encoded = base64.b64encode(byte_array)
-        url_encoded = urlencode.quote(b64_encoded, 'utf-8')
-        return url_encoded
-
-    async def w5_command_data_creator(self, device: W5Fountain, command: W5Command, setting: list) -> list:
+        sequence = self.ble_sequence
+        encoded = _W5_ENCODED.get(command)
+        if encoded is not None:
+            # Only the sequence byte changes between calls for fixed commands
+            return encoded[sequence & 0xFF]
+
+        setting = _W5_SETTING_VALUES.get(command)
+        if setting is None:
+            return ''
+
+        # Same layout as create_ble_byte_list, built directly as bytes from the precomputed prefix
+        # byte_list example = [-6, -4, -3, -35, 1, self.ble_sequence, 13, 0, 3, 3, 0, light_brightness, 0, 0, 0, 0, 0, 5, 40, 1, 104, -5]
+        data_list = self.w5_command_data_creator(device=device, command=command, setting=[setting])
+        data_length = len(data_list)
+        payload = (
+            _W5_SETTINGS_PREFIX
+            + bytes((sequence & 0xFF, data_length & 255, (data_length >> 8) & 255))
+            + bytes([x & 0xFF for x in data_list])
+            + b'\xfb'
+        )
+        return _encode_ble_bytes(payload)
+
+    def w5_command_data_creator(self, device: W5Fountain, command: W5Command, setting: list) -> list:
         """Create W5 settings byte array as list."""
 
         data: list = []
-        device_data = device.data
         if command in W5_SETTINGS_COMMANDS:
-            light_up = await self.short_to_byte_list(input=device_data['settings']['lampRingLightUpTime'])
-            light_out = await self.short_to_byte_list(input=device_data['settings']['lampRingGoOutTime'])
-            disturb_start = await self.short_to_byte_list(input=device_data['settings']['noDisturbingStartTime'])
-            disturb_end = await self.short_to_byte_list(input=device_data['settings']['noDisturbingEndTime'])
+            settings = device.data['settings']
+            light_up = self.short_to_byte_list(input=settings['lampRingLightUpTime'])
+            light_out = self.short_to_byte_list(input=settings['lampRingGoOutTime'])
+            disturb_start = self.short_to_byte_list(input=settings['noDisturbingStartTime'])
+            disturb_end = self.short_to_byte_list(input=settings['noDisturbingEndTime'])
 
             if command in W5_LIGHT_POWER:
-                data = list(chain(
-                                [device_data['settings']['smartWorkingTime']],
-                                [device_data['settings']['smartSleepTime']],
-                                setting,
-                                [device_data['settings']['lampRingBrightness']],
-                                light_up,
-                                light_out,
-                                [device_data['settings']['noDisturbingSwitch']],
-                                disturb_start,
-                                disturb_end,
-                            )
-                        )
-            if command in W5_LIGHT_BRIGHTNESS:
-                data = list(chain(
-                                [device_data['settings']['smartWorkingTime']],
-                                [device_data['settings']['smartSleepTime']],
-                                [device_data['settings']['lampRingSwitch']],
-                                setting,
-                                light_up,
-                                light_out,
-                                [device_data['settings']['noDisturbingSwitch']],
-                                disturb_start,
-                                disturb_end,
-                            )
-                        )
-            if command in W5_DND_COMMANDS:
-                data = list(chain(
-                                [device_data['settings']['smartWorkingTime']],
-                                [device_data['settings']['smartSleepTime']],
-                                [device_data['settings']['lampRingSwitch']],
-                                [device_data['settings']['lampRingBrightness']],
-                                light_up,
-                                light_out,
-                                setting,
-                                disturb_start,
-                                disturb_end,
-                            )
-                        )
+                data = [
+                    settings['smartWorkingTime'],
+                    settings['smartSleepTime'],
+                    *setting,
+                    settings['lampRingBrightness'],
+                    *light_up,
+                    *light_out,
+                    settings['noDisturbingSwitch'],
+                    *disturb_start,
+                    *disturb_end,
+                ]
+            elif command in W5_LIGHT_BRIGHTNESS:
+                data = [
+                    settings['smartWorkingTime'],
+                    settings['smartSleepTime'],
+                    settings['lampRingSwitch'],
+                    *setting,
+                    *light_up,
+                    *light_out,
+                    settings['noDisturbingSwitch'],
+                    *disturb_start,
+                    *disturb_end,
+                ]
+            elif command in W5_DND_COMMANDS:
+                data = [
+                    settings['smartWorkingTime'],
+                    settings['smartSleepTime'],
+                    settings['lampRingSwitch'],
+                    settings['lampRingBrightness'],
+                    *light_up,
+                    *light_out,
+                    *setting,
+                    *disturb_start,
+                    *disturb_end,
+                ]
         return data
 
-    async def create_ble_byte_list(self, command: int, data_list: list[int]) -> list[int]:
+    def create_ble_byte_list(self, command: int, data_list: list[int]) -> list[int]:
         """Creates final byte list which is to be encoded before being sent."""
 
-        byte_list = list(chain(
-            BLE_HEADER,
-            [command],
-            [1],
-            [self.ble_sequence],
-            [(len(data_list) & 255)],
-            [(len(data_list) >> 8)],
-            data_list,
-            [-5]
-        ))
-        return byte_list
+        data_length = len(data_list)
+        return [
+            *BLE_HEADER,
+            command,
+            1,
+            self.ble_sequence,
+            data_length & 255,
+            data_length >> 8,
+            *data_list,
+            -5,
+        ]
 
     @staticmethod
-    async def short_to_byte_list(input: int) -> list:
-        """Take a short and creates a list with bytes represented in int format."""
+    def short_to_byte_list(input: int) -> tuple[int, int]:
+        """Take a short and return its big-endian bytes represented in int format."""
 
-        byte_list: list = []
-        i: int = 0
-        while i < 2:
-            i2: int = i + 1
-            byte_list.append(((input >> (16 - (i2 * 8))) & 255))
-            i = i2
-        return byte_list
+        return (input >> 8) & 255, input & 255
 
     async def get_litter_box_record(self, id: int, type: str, header: dict[str, Any]) -> dict[str, Any]:
         """Fetch the litter box getDeviceRecord endpoint."""
 
-        url = f'{self.base_url}{type}/{Endpoint.DEVICE_RECORD}'
+        url = self._url(Endpoint.DEVICE_RECORD, type)
         data = {
-            'day': str(datetime.now().date()).replace('-', ''),
+            'day': self._today_yyyymmdd(),
             'deviceId': id
         }
         response = await self._post(url, header, data)
@@ -934,29 +1165,29 @@ class PetKitClient:
                     raise PetKitError(f'{water_fountain.data["name"]} is already paused.')
                 else:
                     if water_fountain.data['mode'] == 1:
-                        ble_data = await self.create_ble_data(W5Command.NORMAL_TO_PAUSE, water_fountain)
+                        ble_data = self.create_ble_data(W5Command.NORMAL_TO_PAUSE, water_fountain)
                     else:
-                        ble_data = await self.create_ble_data(W5Command.SMART_TO_PAUSE, water_fountain)
+                        ble_data = self.create_ble_data(W5Command.SMART_TO_PAUSE, water_fountain)
 
             # make sure light is on if brightness is being set
             elif command in W5_LIGHT_BRIGHTNESS:
                 if water_fountain.data['settings']['lampRingSwitch'] != 1:
                     raise PetKitError(f'{water_fountain.data["name"]} indicator light is Off. You can only change light brightness when the indicator light is On.')
                 else:
-                    ble_data = await self.create_ble_data(command, water_fountain)
+                    ble_data = self.create_ble_data(command, water_fountain)
             # Handle all other commands
             else:
-                ble_data = await self.create_ble_data(command, water_fountain)
-            header = await self.create_header()
+                ble_data = self.create_ble_data(command, water_fountain)
+            header = self.create_header()
             conn_data = {
                 'bleId': water_fountain.data['id'],
                 'mac': water_fountain.data['mac'],
                 'type': water_fountain.ble_relay
             }
-            connect_url = f'{self.base_url}{Endpoint.BLE_CONNECT}'
-            poll_url = f'{self.base_url}{Endpoint.BLE_POLL}'
-            command_url = f'{self.base_url}{Endpoint.CONTROL_WF}'
-            disconnect_url = f'{self.base_url}{Endpoint.BLE_CANCEL}'
+            connect_url = self._url(Endpoint.BLE_CONNECT)
+            poll_url = self._url(Endpoint.BLE_POLL)
+            command_url = self._url(Endpoint.CONTROL_WF)
+            disconnect_url = self._url(Endpoint.BLE_CANCEL)
             cmnd_code = W5_COMMAND_TO_CODE[command]
 
             command_data = {
@@ -967,23 +1198,23 @@ class PetKitClient:
                 'type': water_fountain.ble_relay
             }
             # Initiate BLE connection and poll
-            conn_success = await self.start_ble_connection(connect_url, header, conn_data, 1)
+            await self._settle_ble_disconnects(conn_data['bleId'])
+            conn_success = await self.start_ble_connection(connect_url, header, conn_data)
             if conn_success:
-                poll_success = await self.poll_ble_connection(poll_url, header, conn_data, 1)
+                poll_success = await self.poll_ble_connection(poll_url, header, conn_data)
                 if poll_success:
-                    # Ensure BLE connection is made before sending command
-                    await asyncio.sleep(4)
                     # Send command to water fountain via BLE relay
-                    await self._post(command_url, header, command_data)
+                    await self._send_wf_command(command_url, header, command_data)
                     # Reset ble_sequence
                     self.ble_sequence = 0
+                    # The cached state no longer reflects the water fountain
+                    self._fountain_cache.pop(water_fountain.id, None)
                     # Sever Relay connection when done
-                    await asyncio.sleep(2)
-                    await self._post(disconnect_url, header, conn_data)
+                    await self._ble_disconnect(disconnect_url, header, conn_data)
                 else:
-                    raise BluetoothError(f'BLE polling step failed while attempting to send the command to the water fountain')
+                    raise BluetoothError('BLE polling step failed while attempting to send the command to the water fountain')
             else:
-                raise BluetoothError(f'BLE connection step failed while attempting to send the command to the water fountain')
+                raise BluetoothError('BLE connection step failed while attempting to send the command to the water fountain')
             
 #            await self._post(connect_url, header, conn_data)
 #            await self._post(poll_url, header, conn_data)
@@ -994,21 +1225,42 @@ class PetKitClient:
             # Reset ble_sequence
 #            self.ble_sequence = 0
 
+    async def _send_wf_command(self, command_url: str, header: dict[str, str], command_data: dict[str, Any]) -> None:
+        """Send a water fountain command, retrying with backoff if the BLE relay reports an error."""
+
+        # Ensure BLE connection is made before sending command
+        await asyncio.sleep(2)
+        backoff = 0.5
+        for attempt in range(1, 5):
+            try:
+                await self._post(command_url, header, command_data)
+                return
+            except BluetoothError:
+                if attempt == 4:
+                    raise
+                LOGGER.debug('Water fountain command attempt %s failed. Retrying.', attempt)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 4)
+
     async def call_pet(self, feeder: Feeder) -> None:
         """Call pet on D3 (Infinity) feeder."""
 
-        url = f'{self.base_url}{feeder.type}/{Endpoint.CALL_PET}'
-        header = await self.create_header()
-        data = {
-            'deviceId': feeder.id
-        }
+        url = self._url(Endpoint.CALL_PET, feeder.type)
+        header = self.create_header()
+        data = self._id_payload(feeder.id, 'deviceId')
         await self._post(url, header, data)
 
     async def control_litter_box(self, litter_box: LitterBox, command: LitterBoxCommand) -> None:
         """Control PetKit litter boxes."""
 
-        url = f'{self.base_url}{litter_box.type}/{Endpoint.CONTROL_DEVICE}'
-        value: int = 0
+        url = self._url(Endpoint.CONTROL_DEVICE, litter_box.type)
+        header = self.create_header()
+        await self._dispatch_litter_box_command(url, header, litter_box, command)
+
+    async def _dispatch_litter_box_command(
+        self, url: str, header: dict[str, str], litter_box: LitterBox, command: LitterBoxCommand
+    ) -> None:
+        """Send a litter box command using a URL and header built by control_litter_box."""
 
         if litter_box.type == 't4':
             if command == LitterBoxCommand.START_CLEAN:
@@ -1028,26 +1280,18 @@ class PetKitClient:
                 ## The manual pause will end after a 10-minute wait + 1 minute to complete cleaning
                 self.manual_pause_end[litter_box.id] = datetime.now() + timedelta(seconds=660)
 
+        key, cmd_type, value = LB_CMD_INFO[command]
         if command == LitterBoxCommand.POWER:
             #If litter box is currently turned on then you want the command to turn it off
             if litter_box.device_detail['state']['power'] == 1:
                 value = 0
             else:
                 value = 1
-        # For all non-power commands, get the value associated with the command
-        else:
-            value = LB_CMD_TO_VALUE[command]
 
-        key = LB_CMD_TO_KEY[command]
-        header = await self.create_header()
-
-        command_dict = {
-            key: value
-        }
         data = {
             'id': litter_box.id,
-            'kv': json.dumps(command_dict),
-            'type': LB_CMD_TO_TYPE[command]
+            'kv': _kv(key, value),
+            'type': cmd_type
         }
         await self._post(url, header, data)
 
@@ -1064,7 +1308,7 @@ class PetKitClient:
                     last_item = record['result'][-1]
                     if last_item['enumEventType'] == 'clean_over':
                         if (last_item['content']['startReason'] in [0, 1, 2, 3]) and (last_item['content']['result'] == 3):
-                            await self.control_litter_box(litter_box, LitterBoxCommand.RESUME_CLEAN)
+                            await self._dispatch_litter_box_command(url, header, litter_box, LitterBoxCommand.RESUME_CLEAN)
                             self.manually_paused[litter_box.id] = False
                             self.manual_pause_end[litter_box.id] = None
 
@@ -1076,34 +1320,27 @@ class PetKitClient:
     async def control_purifier(self, purifier: Purifier, command: PurifierCommand) -> None:
         """Control PetKit purifiers."""
 
-        url = f'{self.base_url}{purifier.type}/{Endpoint.CONTROL_DEVICE}'
-        value: int = 0
+        url = self._url(Endpoint.CONTROL_DEVICE, purifier.type)
+        key, cmd_type, value = PUR_CMD_INFO[command]
         if command == PurifierCommand.POWER:
             # Power of 1 means it is on. Power of 2 means it is on and in standby mode
             if purifier.device_detail['state']['power'] in [1, 2]:
                 value = 0
             else:
                 value = 1
-        else:
-            value = PUR_CMD_TO_VALUE[command]
-        key = PUR_CMD_TO_KEY[command]
-        header = await self.create_header()
-        command_dict = {
-            key: value
-        }
+        header = self.create_header()
         data = {
             'id': purifier.id,
-            'kv': json.dumps(command_dict),
-            'type': PUR_CMD_TO_TYPE[command]
+            'kv': _kv(key, value),
+            'type': cmd_type
         }
         await self._post(url, header, data)
 
-    async def check_manual_pause_expiration(self, id: int):
+    def check_manual_pause_expiration(self, id: int) -> None:
         """Check to see if manual pause has expired and litter box resumed the cleaning on its own."""
 
-        current_dt = datetime.now()
-        current_end = self.manual_pause_end[id]
-        if (current_end - current_dt).total_seconds() <= 0:
+        current_end = self.manual_pause_end.get(id)
+        if current_end is None or datetime.now() >= current_end:
             self.manual_pause_end[id] = None
             self.manually_paused[id] = False
 
@@ -1113,16 +1350,11 @@ class PetKitClient:
         D4 (Element Solo) allowed amount is 10, 20, 30, 40, 50.
         """
 
-        if feeder.type == 'feedermini':
-            url = f'{self.base_url}{Endpoint.MINI_MANUAL_FEED}'
-        elif feeder.type == 'feeder':
-            url = f'{self.base_url}{Endpoint.FRESH_ELEMENT_MANUAL_FEED}'
-        else:
-            url = f'{self.base_url}{feeder.type}/{Endpoint.MANUAL_FEED}'
-        header = await self.create_header()
+        url = self._feeder_url(feeder.type, 'manual_feed')
+        header = self.create_header()
         data = {
             'amount': amount,
-            'day': str(datetime.now().date()).replace('-', ''),
+            'day': self._today_yyyymmdd(),
             'deviceId': feeder.id,
             'time': '-1'
         }
@@ -1138,12 +1370,12 @@ class PetKitClient:
         if invalid_amount1 or invalid_amount2:
             raise PetKitError('Invalid portion amount specified. Each hopper can only take a portion value between/including 0 to 10')
         else:
-            url = f'{self.base_url}{feeder.type}/{Endpoint.MANUAL_FEED}'
-            header = await self.create_header()
+            url = self._url(Endpoint.MANUAL_FEED, feeder.type)
+            header = self.create_header()
             data = {
                 'amount1': amount1,
                 'amount2': amount2,
-                'day': str(datetime.now().date()).replace('-', ''),
+                'day': self._today_yyyymmdd(),
                 'deviceId': feeder.id,
                 'name': '',
                 'time': '-1'
@@ -1155,81 +1387,80 @@ class PetKitClient:
     async def update_feeder_settings(self, feeder: Feeder, setting: FeederSetting, value: int) -> None:
         """Change the setting on a feeder."""
 
-        if feeder.type == 'feedermini':
-            url = f'{self.base_url}{Endpoint.MINI_SETTING}'
-        # Fresh Element Feeder
-        elif feeder.type == 'feeder':
-            url = f'{self.base_url}{Endpoint.FRESH_ELEMENT_SETTING}'
-        # D3 and D4 Feeders
-        else:
-            url = f'{self.base_url}{feeder.type}/{Endpoint.UPDATE_SETTING}'
-        header = await self.create_header()
-        setting_dict = {
-            setting: value
-        }
+        url = self._feeder_url(feeder.type, 'setting')
+        header = self.create_header()
         data = {
             'id': feeder.id,
-            'kv': json.dumps(setting_dict)
+            'kv': _kv(setting, value)
         }
         await self._post(url, header, data)
 
     async def update_litter_box_settings(self, litter_box: LitterBox, setting: LitterBoxSetting | None = None, value: int | None = None) -> None:
         """Change the setting on a litter box."""
 
-        url = f'{self.base_url}{litter_box.type}/{Endpoint.UPDATE_SETTING}'
-        header = await self.create_header()
-        setting_dict = {
-            setting: value
-        }
+        url = self._url(Endpoint.UPDATE_SETTING, litter_box.type)
+        header = self.create_header()
         data = {
             'id': litter_box.id,
-            'kv': json.dumps(setting_dict)
+            'kv': _kv(setting, value)
         }
         await self._post(url, header, data)
 
     async def update_pet_settings(self, pet: Pet, setting: PetSetting, value: int | float) -> None:
         """Change the setting for a pet."""
 
-        url = f'{self.base_url}{Endpoint.PET_PROPS}'
-        header = await self.create_header()
-        setting_dict = {
-            setting: value
-        }
+        url = self._url(Endpoint.PET_PROPS)
+        header = self.create_header()
         data = {
-            'petId': int(pet.id),
-            'kv': json.dumps(setting_dict)
+            'petId': pet.id,
+            'kv': _kv(setting, value)
         }
         await self._post(url, header, data)
 
     async def update_purifier_settings(self, purifier: Purifier, setting: PurifierSetting, value: int) -> None:
         """Change the setting on a purifier."""
 
-        url = f'{self.base_url}{purifier.type}/{Endpoint.UPDATE_SETTING}'
-        header = await self.create_header()
-        setting_dict = {
-            setting: value
-        }
+        url = self._url(Endpoint.UPDATE_SETTING, purifier.type)
+        header = self.create_header()
         data = {
             'id': purifier.id,
-            'kv': json.dumps(setting_dict)
+            'kv': _kv(setting, value)
         }
         await self._post(url, header, data)
 
+    async def update_settings_concurrently(
+        self, updates: list[tuple[Feeder | LitterBox | Pet | Purifier, Any, int | float]]
+    ) -> None:
+        """Apply (device, setting, value) updates across devices and pets concurrently, one request per update."""
+
+        tasks = []
+        for device, setting, value in updates:
+            if isinstance(device, Feeder):
+                tasks.append(self.update_feeder_settings(device, setting, value))
+            elif isinstance(device, LitterBox):
+                tasks.append(self.update_litter_box_settings(device, setting, value))
+            elif isinstance(device, Pet):
+                tasks.append(self.update_pet_settings(device, setting, value))
+            elif isinstance(device, Purifier):
+                tasks.append(self.update_purifier_settings(device, setting, value))
+            else:
+                # Close the coroutines already created so they don't warn about never being awaited
+                for task in tasks:
+                    task.close()
+                raise PetKitError(f'Settings can not be updated for {type(device).__name__} objects.')
+        await asyncio.gather(*tasks)
+
     async def cancel_manual_feed(self, feeder: Feeder) -> None:
         """Cancel a manual feed that is currently in progress. Not available for mini feeders"""
 
-        # Fresh Element feeder
-        if feeder.type == 'feeder':
-            url = f'{self.base_url}{feeder.type}/{Endpoint.FRESH_ELEMENT_CANCEL_FEED}'
-        else:
-            url = f'{self.base_url}{feeder.type}/{Endpoint.CANCEL_FEED}'
-        header = await self.create_header()
+        url = self._feeder_url(feeder.type, 'cancel_feed')
+        header = self.create_header()
         if feeder.type == 'd4s':
             if feeder.last_manual_feed_id is None:
                 raise PetKitError('Unable to cancel manual feeding. No valid last manual feeding ID found.')
             else:
                 data = {
-                    'day': str(datetime.now().date()).replace('-', ''),
+                    'day': self._today_yyyymmdd(),
                     'deviceId': feeder.id,
                     'id': feeder.last_manual_feed_id
                 }
@@ -1238,7 +1469,7 @@ class PetKitClient:
                 feeder.last_manual_feed_id = None
         else:
             data = {
-                'day': str(datetime.now().date()).replace('-', ''),
+                'day': self._today_yyyymmdd(),
                 'deviceId': feeder.id
             }
         await self._post(url, header, data)
@@ -1246,17 +1477,9 @@ class PetKitClient:
     async def reset_feeder_desiccant(self, feeder: Feeder) -> None:
         """Reset the desiccant of a single feeder."""
 
-        if feeder.type == 'feedermini':
-            url = f'{self.base_url}{Endpoint.MINI_DESICCANT_RESET}'
-        # Fresh Element Feeder
-        elif feeder.type == 'feeder':
-            url = f'{self.base_url}{Endpoint.FRESH_ELEMENT_DESICCANT_RESET}'
-        else:
-            url = f'{self.base_url}{feeder.type}/{Endpoint.FEEDER_DESICCANT_RESET}'
-        header = await self.create_header()
-        data = {
-            'deviceId': feeder.id
-        }
+        url = self._feeder_url(feeder.type, 'desiccant_reset')
+        header = self.create_header()
+        data = self._id_payload(feeder.id, 'deviceId')
         await self._post(url, header, data)
 
     async def reset_pura_max_deodorizer(self, litter_box: LitterBox) -> None:
@@ -1264,11 +1487,9 @@ class PetKitClient:
 
         if litter_box.type != 't4':
             raise PetKitError('Invalid litter box type. Only Pura Max litter boxes have N50 odor eliminators.')
-        url = f'{self.base_url}{litter_box.type}/{Endpoint.MAX_ODOR_RESET}'
-        header = await self.create_header()
-        data = {
-            'deviceId': litter_box.id
-        }
+        url = self._url(Endpoint.MAX_ODOR_RESET, litter_box.type)
+        header = self.create_header()
+        data = self._id_payload(litter_box.id, 'deviceId')
         await self._post(url, header, data)
 
     async def food_replenished(self, feeder: Feeder) -> None:
@@ -1281,8 +1502,8 @@ class PetKitClient:
         if feeder.type != 'd4s':
             raise PetKitError('The food_replenished method is only used with D4s (Gemini) feeders.')
         else:
-            url = f'{self.base_url}{feeder.type}/{Endpoint.REPLENISHED_FOOD}'
-            header = await self.create_header()
+            url = self._url(Endpoint.REPLENISHED_FOOD, feeder.type)
+            header = self.create_header()
             data = {
                 'deviceId': feeder.id,
                 'noRemind': 3
@@ -1297,8 +1518,8 @@ class PetKitClient:
         if feeder.type != 'feeder':
             raise PetKitError('Calibration is only used for Fresh Element feeders.')
         else:
-            url = f'{self.base_url}{feeder.type}/{Endpoint.FRESH_ELEMENT_CALIBRATION}'
-            header = await self.create_header()
+            url = self._url(Endpoint.FRESH_ELEMENT_CALIBRATION, feeder.type)
+            header = self.create_header()
             if command == FeederCommand.START_CALIBRATION:
                 value = 1
             else:
@@ -20,4 +20,4 @@ class StrEnum(str, Enum):
 
     def __str__(self) -> str:
         """Return self.value."""
-        return str(self.value)
\ No newline at end of file
+        return self.value
\ No newline at end of file
@@ -16,9 +16,13 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     python_requires= ">=3.7",
     install_requires=[
-        "aiohttp>=3.8.1",
+        "aiohttp>=3.9.0; python_version>='3.8'",
+        "aiohttp>=3.8.1; python_version<'3.8'",
         "tzlocal>=4.2",
     ],
+    extras_require={
+        "fast": ["orjson>=3.10.0; python_version>='3.8'"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+
+from petkitaio import PetKitClient
+from petkitaio.exceptions import AuthError, PetKitError
+
+
+class FakeResponse:
+    """Minimal stand-in for aiohttp's ClientResponse."""
+
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+def response(status: int, body: bytes):
+    return asyncio.run(PetKitClient._response(FakeResponse(status, body)))
+
+
+class ResponseTests(unittest.TestCase):
+
+    def test_success(self):
+        self.assertEqual(response(200, b'{"result": "success"}'), {'result': 'success'})
+
+    def test_error_code_mapped_on_error_status(self):
+        with self.assertRaises(AuthError):
+            response(401, b'{"error": {"code": 5, "msg": "Session expired"}}')
+
+    def test_json_body_without_error_code_on_error_status(self):
+        with self.assertRaisesRegex(PetKitError, 'Status: 503; Error: {"message":"Service Unavailable"}'):
+            response(503, b'{"message":"Service Unavailable"}')
+
+    def test_non_json_body_on_error_status(self):
+        with self.assertRaisesRegex(PetKitError, 'Status: 502'):
+            response(502, b'<html>Bad Gateway</html>')
+
+
+if __name__ == '__main__':
+    unittest.main()